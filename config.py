@@ -35,6 +35,18 @@ vvp_scheme_name_short = 'VVP'
 law_bs_collection_label = 'Systematische Gesetzessammlung Basel-Stadt'
 law_ch_collection_label = 'Systematische Rechtssammlung Schweiz'
 
+# Staatskalender: number of parallel requests when prefetching memberships and persons
+staatskalender_prefetch_max_workers = 4
+
+# Staatskalender: minimum time in seconds between two lookups started by the prefetch workers (shared by all workers)
+staatskalender_prefetch_request_interval_sec = 1.0
+
+# Staatskalender: minimum time in seconds between two membership lookups (check #2 loop and prefetch)
+staatskalender_membership_lookup_interval_sec = 5.0
+
+# Staatskalender: (connect, read) timeout in seconds for API requests
+staatskalender_timeout_sec = (5, 60)
+
 # Special names
 tenant_name = "Mandant"
 organizations_name = "Data%20Governance"
@@ -1,5 +1,6 @@
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple
 
 import config
@@ -40,7 +41,8 @@ def check_2_staatskalender_assignment(dataspot_client: BaseDataspotClient, staat
               This mapping (staatskalender_post_person_mapping) is provided for reuse in check_3 to avoid
               redundant Staatskalender API calls.
               Additionally returns validation_status_by_post, indicating for each post whether
-              membership validation was fully successful ("validated") or unresolved ("failed").
+              membership validation was fully successful ("validated") or unresolved ("failed"),
+              and posts_with_membership, the posts with membership IDs that were checked (reused by check_3).
     """
     logging.debug("Starting Check #2: Personensynchronisation aus dem Staatskalender...")
     
@@ -50,16 +52,22 @@ def check_2_staatskalender_assignment(dataspot_client: BaseDataspotClient, staat
         'issues': [],
         'error': None,
         'staatskalender_post_person_mapping': [],
-        'validation_status_by_post': {}
+        'validation_status_by_post': {},
+        'posts_with_membership': None
     }
 
     try:
-        # Initialize BaseDataspotClient
-        base_dataspot_client = BaseDataspotClient(scheme_name="NOT_IN_USE",
-                                                  scheme_name_short="404NotFound")
-        
-        # Get all posts with sk_membership_id or sk_second_membership_id
-        posts_with_membership = get_posts_with_sk_membership_ids(dataspot_client)
+        # Get all posts with sk_membership_id or sk_second_membership_id and load the person caches.
+        # The two queries are independent, so they are sent concurrently.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            posts_future = executor.submit(get_posts_with_sk_membership_ids, dataspot_client)
+            person_caches_future = None
+            if _person_cache is None or _person_with_sk_id_cache is None:
+                person_caches_future = executor.submit(_load_person_caches, dataspot_client)
+            posts_with_membership = posts_future.result()
+            if person_caches_future:
+                person_caches_future.result()
+        result['posts_with_membership'] = posts_with_membership
         
         if not posts_with_membership:
             result['message'] = 'No posts with membership IDs found.'
@@ -68,7 +76,7 @@ def check_2_staatskalender_assignment(dataspot_client: BaseDataspotClient, staat
         logging.info(f"Found {len(posts_with_membership)} posts with membership IDs to verify")
 
         # Process person synchronization from Staatskalender
-        process_person_sync(posts_with_membership, base_dataspot_client, result, staatskalender_cache)
+        process_person_sync(posts_with_membership, dataspot_client, result, staatskalender_cache)
 
         # Update final status and message
         if result['issues']:
@@ -163,15 +171,28 @@ def process_person_sync(posts: Dict[str, Tuple[str, List[str]]], dataspot_client
     """
     total_posts = len(posts)
     
+    # Local reference to the issues list, appended to for every finding in the loop below
+    issues = result['issues']
+    
+    # Load all memberships and their persons from Staatskalender in parallel. The posts are then processed
+    # one by one, as creating and updating persons in Dataspot depends on the results of previous posts.
+    staatskalender_cache.prefetch_memberships(
+        sk_membership_id for _, memberships in posts.values() for sk_membership_id in memberships
+    )
+    
     for current_post, (post_uuid, (post_label, memberships)) in enumerate(posts.items(), 1):
         post_validation_failed = False
+        # Primary and secondary membership may belong to the same person; each person is only processed once per post
+        processed_sk_person_ids = set()
 
         # Log post header with progress indicator
         logging.info(f"[{current_post}/{total_posts}] {post_label}:")
         
         for sk_membership_id in memberships:
-            # Add a delay to prevent overwhelming the API
-            time.sleep(5)
+            # Add a delay to prevent overwhelming the API. Memberships loaded by prefetch_memberships() above were
+            # already requested with the same spacing, so the delay is only needed if the lookup sends a request here.
+            if not staatskalender_cache.is_membership_cached(sk_membership_id):
+                time.sleep(config.staatskalender_membership_lookup_interval_sec)
 
             # Retrieve membership and person data from staatskalender using cache
             try:
@@ -184,10 +205,15 @@ def process_person_sync(posts: Dict[str, Tuple[str, List[str]]], dataspot_client
                 sk_last_name = person_data['family_name']
                 sk_email = person_data.get('email')
 
+                if sk_person_id in processed_sk_person_ids:
+                    logging.info(f' - Membership {sk_membership_id} belongs to the same person as another membership of this post')
+                    continue
+                processed_sk_person_ids.add(sk_person_id)
+
                 if not sk_first_name or not sk_last_name:
                     # Missing essential person data
                     post_validation_failed = True
-                    result['issues'].append({
+                    issues.append({
                         'type': 'person_data_incomplete',
                         'post_uuid': post_uuid,
                         'post_label': post_label,
@@ -216,7 +242,7 @@ def process_person_sync(posts: Dict[str, Tuple[str, List[str]]], dataspot_client
                                 additional_name=sk_additional_name,
                                 family_name=sk_last_name
                             )
-                            result['issues'].append({
+                            issues.append({
                                 'type': 'person_name_update',
                                 'post_uuid': post_uuid,
                                 'post_label': post_label,
@@ -233,7 +259,7 @@ def process_person_sync(posts: Dict[str, Tuple[str, List[str]]], dataspot_client
                             logging.info(f' - Updated person name from "{existing_first_name} {existing_last_name}" to "{sk_first_name} {sk_last_name}" (Link: {config.base_url}/web/{config.database_name}/persons/{person_uuid})')
                         except Exception as e:
                             post_validation_failed = True
-                            result['issues'].append({
+                            issues.append({
                                 'type': 'person_name_update_failed',
                                 'post_uuid': post_uuid,
                                 'post_label': post_label,
@@ -266,16 +292,14 @@ def process_person_sync(posts: Dict[str, Tuple[str, List[str]]], dataspot_client
                     else:
                         # Person doesn't exist, create it using the existing method
                         try:
-                            person_uuid, person_newly_created = dataspot_client.ensure_person_exists(sk_first_name, sk_last_name)
+                            person_uuid, person_newly_created = dataspot_client.ensure_person_exists(sk_first_name, sk_last_name, sk_person_id)
                             
                             if person_newly_created:
-                                # Reset caches since a new person was created
-                                global _person_with_sk_id_cache, _person_cache
-                                _person_with_sk_id_cache = None
-                                _person_cache = None
+                                # Add the new person (created with its sk_person_id) to the caches
+                                _update_person_caches(person_uuid, sk_first_name, sk_last_name, sk_person_id)
 
                                 # Add remediation issue stating that the person was created
-                                result['issues'].append({
+                                issues.append({
                                     'type': 'person_created',
                                     'post_uuid': post_uuid,
                                     'post_label': post_label,
@@ -293,7 +317,7 @@ def process_person_sync(posts: Dict[str, Tuple[str, List[str]]], dataspot_client
                                 logging.info(f' - Person {sk_first_name} {sk_last_name} already exists')
                         except Exception as e:
                             post_validation_failed = True
-                            result['issues'].append({
+                            issues.append({
                                 'type': 'person_creation_failed',
                                 'post_uuid': post_uuid,
                                 'post_label': post_label,
@@ -309,9 +333,9 @@ def process_person_sync(posts: Dict[str, Tuple[str, List[str]]], dataspot_client
 
                     # Now ensure that the person has the correct sk_person_id
                     try:
-                        person_sk_id_updated = ensure_correct_person_sk_id(dataspot_client, person_uuid, sk_person_id)
+                        person_sk_id_updated = ensure_correct_person_sk_id(dataspot_client, person_uuid, sk_person_id, sk_first_name, sk_last_name)
                         if person_sk_id_updated:
-                            result['issues'].append({
+                            issues.append({
                                 'type': 'person_sk_id_updated',
                                 'post_uuid': post_uuid,
                                 'post_label': post_label,
@@ -329,7 +353,7 @@ def process_person_sync(posts: Dict[str, Tuple[str, List[str]]], dataspot_client
                             logging.info(f' - Person {sk_first_name} {sk_last_name} already has correct sk_person_id')
                     except Exception as e:
                         post_validation_failed = True
-                        result['issues'].append({
+                        issues.append({
                             'type': 'person_sk_id_update_failed',
                             'post_uuid': post_uuid,
                             'post_label': post_label,
@@ -363,7 +387,7 @@ def process_person_sync(posts: Dict[str, Tuple[str, List[str]]], dataspot_client
                         f"    • If that link does not work, check https://staatskalender.bs.ch/membership/{sk_membership_id} — if it also fails, the membership no longer exists in the Staatskalender; then either delete this post or update it with a valid membership ID."
                     )
                 
-                result['issues'].append({
+                issues.append({
                     'type': issue_type,
                     'post_uuid': post_uuid,
                     'post_label': post_label,
@@ -372,12 +396,52 @@ def process_person_sync(posts: Dict[str, Tuple[str, List[str]]], dataspot_client
                     'remediation_attempted': False,
                     'remediation_success': False
                 })
-                logging.error(f"Error processing membership ID {sk_membership_id}: {error_message}")
+                # Traceback only at debug level; frequent network errors would otherwise flood the log
+                logging.error(f"Error processing membership ID {sk_membership_id}: {error_message}",
+                              exc_info=logging.getLogger().isEnabledFor(logging.DEBUG))
                 logging.error(f"Membership URL: https://staatskalender.bs.ch/membership/{sk_membership_id}")
 
         result['validation_status_by_post'][post_uuid] = 'failed' if post_validation_failed else 'validated'
 
 
+def _load_person_caches(dataspot_client: BaseDataspotClient) -> None:
+    """
+    Load both person caches (by sk_person_id and by name) with a single query.
+
+    Args:
+        dataspot_client: Database client
+
+    Returns:
+        None (sets _person_with_sk_id_cache and _person_cache)
+    """
+    global _person_with_sk_id_cache, _person_cache
+
+    logging.debug("Loading person caches...")
+    query = """
+    SELECT
+        p.id,
+        p.given_name,
+        p.family_name,
+        cp.value AS sk_person_id
+    FROM
+        person_view p
+    LEFT JOIN
+        customproperties_view cp ON p.id = cp.resource_id AND cp.name = 'sk_person_id'
+    ORDER BY
+        p.family_name, p.given_name
+    """
+    results = dataspot_client.execute_query_api(sql_query=query)
+    _person_with_sk_id_cache = {}
+    _person_cache = {}
+    for result in results:
+        if result['sk_person_id'] is not None:
+            sk_id = result['sk_person_id'].strip('"')
+            _person_with_sk_id_cache[sk_id] = (True, result['given_name'], result['family_name'], result['id'])
+        person_name = f"{result['given_name']} {result['family_name']}"
+        _person_cache[person_name] = result['id']
+    logging.debug(f"Person caches loaded with {len(_person_with_sk_id_cache)} persons with sk_person_id "
+                  f"and {len(_person_cache)} persons by name")
+
 # DONE
 def check_person_with_corresponding_sk_person_id_already_exists(dataspot_client: BaseDataspotClient, sk_person_id: str) -> Tuple[bool, str, str, str]:
     """
@@ -394,30 +458,9 @@ def check_person_with_corresponding_sk_person_id_already_exists(dataspot_client:
             - str: Last name of the person if found, "no_last_name" if not found
             - str: UUID of the person in dataspot, "no_person_uuid" if not found
     """
-    global _person_with_sk_id_cache
-
     # Load cache if not already loaded
     if _person_with_sk_id_cache is None:
-        logging.debug("Loading person cache...")
-        query = """
-        SELECT
-            p.id,
-            p.given_name,
-            p.family_name,
-            cp.value AS sk_person_id
-        FROM
-            person_view p
-        JOIN
-            customproperties_view cp ON p.id = cp.resource_id
-        WHERE
-            cp.name = 'sk_person_id'
-        """
-        results = dataspot_client.execute_query_api(sql_query=query)
-        _person_with_sk_id_cache = {}
-        for result in results:
-            sk_id = result['sk_person_id'].strip('"')
-            _person_with_sk_id_cache[sk_id] = (True, result['given_name'], result['family_name'], result['id'])
-        logging.debug(f"Person with sk_person_id cache loaded with {len(_person_with_sk_id_cache)} entries")
+        _load_person_caches(dataspot_client)
 
     # Check if person exists in cache
     if sk_person_id in _person_with_sk_id_cache:
@@ -441,27 +484,9 @@ def find_person_by_name(dataspot_client: BaseDataspotClient, first_name: str, la
             - bool: True if a person with the given name exists, False otherwise
             - str: UUID of the person if found, "no_person_uuid" if not found
     """
-    global _person_cache
-
     # Load cache if not already loaded
     if _person_cache is None:
-        logging.debug("Loading all persons cache...")
-        query = """
-        SELECT
-            p.id,
-            p.given_name,
-            p.family_name
-        FROM
-            person_view p
-        ORDER BY
-            p.family_name, p.given_name
-        """
-        results = dataspot_client.execute_query_api(sql_query=query)
-        _person_cache = {}
-        for result in results:
-            person_name = f"{result['given_name']} {result['family_name']}"
-            _person_cache[person_name] = result['id']
-        logging.debug(f"All persons cache loaded with {len(_person_cache)} entries")
+        _load_person_caches(dataspot_client)
 
     # Check if person exists in cache
     person_name = f"{first_name} {last_name}"
@@ -471,6 +496,36 @@ def find_person_by_name(dataspot_client: BaseDataspotClient, first_name: str, la
     # Person not found in cache, return not found
     return False, "no_person_uuid"
 
+def _update_person_caches(person_uuid: str, given_name: str, family_name: str, sk_person_id: str = None) -> None:
+    """
+    Update the person caches in place after a person was created or modified.
+
+    Resetting the caches instead would reload all persons with the next lookup, i.e. one full query
+    per modified person. Caches that are not loaded yet are left untouched.
+
+    Args:
+        person_uuid: UUID of the created or modified person
+        given_name: Person's (new) first name
+        family_name: Person's (new) last name
+        sk_person_id: Person's new Staatskalender ID, if it was changed
+
+    Returns:
+        None
+    """
+    if _person_cache is not None:
+        for person_name in [name for name, uuid in _person_cache.items() if uuid == person_uuid]:
+            del _person_cache[person_name]
+        _person_cache[f"{given_name} {family_name}"] = person_uuid
+
+    if _person_with_sk_id_cache is not None:
+        sk_ids = [sk_id for sk_id, entry in _person_with_sk_id_cache.items() if entry[3] == person_uuid]
+        if sk_person_id is not None:
+            for sk_id in sk_ids:
+                del _person_with_sk_id_cache[sk_id]
+            sk_ids = [sk_person_id]
+        for sk_id in sk_ids:
+            _person_with_sk_id_cache[sk_id] = (True, given_name, family_name, person_uuid)
+
 # DONE
 def update_person_name(dataspot_client: BaseDataspotClient, person_uuid: str, given_name: str, family_name: str, additional_name: str = None) -> None:
     """
@@ -505,43 +560,52 @@ def update_person_name(dataspot_client: BaseDataspotClient, person_uuid: str, gi
 
     response.raise_for_status()
 
-    # Reset caches since person data was modified
-    global _person_with_sk_id_cache, _person_cache
-    _person_with_sk_id_cache = None
-    _person_cache = None
+    # Update caches since person data was modified
+    _update_person_caches(person_uuid, given_name, family_name)
 
 # DONE
-def ensure_correct_person_sk_id(dataspot_client: BaseDataspotClient, person_uuid: str, sk_person_id: str) -> bool:
+def ensure_correct_person_sk_id(dataspot_client: BaseDataspotClient, person_uuid: str, sk_person_id: str, given_name: str, family_name: str) -> bool:
     """
     Ensure that a person has the correct Staatskalender ID.
 
+    The current sk_person_id is taken from the person cache, which is loaded from the Query API before
+    this function is called. The person is only retrieved via REST if the cache is not loaded.
+
     Args:
         dataspot_client: Database client
         person_uuid: Person UUID to update
         sk_person_id: Staatskalender person ID
+        given_name: Person's first name (used to update the caches)
+        family_name: Person's last name (used to update the caches)
         
     Returns:
         bool: True if the sk_person_id was updated, False otherwise
     """
-    # First check if the property already exists using the REST API
     person_url = f"{config.base_url}/rest/{config.database_name}/persons/{person_uuid}"
-    response = requests_get(
-        url=person_url,
-        headers=dataspot_client.auth.get_headers()
-    )
-    
-    if response.status_code != 200:
-        logging.error(f"Failed to retrieve person with UUID {person_uuid}. Status code: {response.status_code}")
-        return False
-    
-    person_data = response.json()
+
+    if _person_with_sk_id_cache is not None:
+        current_sk_person_id = next(
+            (sk_id for sk_id, entry in _person_with_sk_id_cache.items() if entry[3] == person_uuid), None
+        )
+    else:
+        # Check if the property already exists using the REST API
+        response = requests_get(
+            url=person_url,
+            headers=dataspot_client.auth.get_headers()
+        )
+
+        if response.status_code != 200:
+            logging.error(f"Failed to retrieve person with UUID {person_uuid}. Status code: {response.status_code}")
+            return False
+
+        current_sk_person_id = response.json().get('sk_person_id')
     
     # Check if the sk_person_id is already correctly set
-    if person_data.get('sk_person_id') == sk_person_id:
+    if current_sk_person_id == sk_person_id:
         logging.debug(f'   - sk_person_id already correctly set: {sk_person_id}')
         return False
     
-    logging.debug(f'   - Updating sk_person_id from {person_data.get("sk_person_id")} to {sk_person_id}')
+    logging.debug(f'   - Updating sk_person_id from {current_sk_person_id} to {sk_person_id}')
 
     # If not, update sk_person_id
     person_update = {
@@ -559,8 +623,6 @@ def ensure_correct_person_sk_id(dataspot_client: BaseDataspotClient, person_uuid
 
     response.raise_for_status()
     
-    # Reset caches since person data was modified
-    global _person_with_sk_id_cache, _person_cache
-    _person_with_sk_id_cache = None
-    _person_cache = None
+    # Update caches since person data was modified
+    _update_person_caches(person_uuid, given_name, family_name, sk_person_id)
     return True
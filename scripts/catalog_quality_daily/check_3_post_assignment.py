@@ -9,7 +9,8 @@ from src.clients.base_client import BaseDataspotClient
 def check_3_post_assignment(
     dataspot_client: BaseDataspotClient,
     staatskalender_post_person_mapping: List[Tuple[str, str]],
-    validation_status_by_post: Optional[Dict[str, str]] = None
+    validation_status_by_post: Optional[Dict[str, str]] = None,
+    posts_with_membership: Optional[Dict[str, Tuple[str, List[str]]]] = None
 ) -> Dict[str, any]:
     """
     Check #3: Mitgliedschaftsbasierte Posten-Zuordnungen
@@ -42,6 +43,9 @@ def check_3_post_assignment(
         validation_status_by_post: Optional mapping from post_uuid to validation status from check_2.
                                    Expected values are "validated" or "failed". Posts marked as
                                    "failed" are reported but not mutated.
+        posts_with_membership: Optional posts with membership IDs as already retrieved by check_2
+                               (key: post_uuid, value: (post_label, [sk_membership_ids])). If not
+                               provided, they are retrieved from dataspot.
         
     Returns:
         dict: Check results including status, issues, and any errors
@@ -57,34 +61,38 @@ def check_3_post_assignment(
 
     logging.info("Processing post assignments using mapping-based approach")
 
-    # Retrieve current post assignments from dataspot
+    # Retrieve current post assignments and all person names from dataspot in a single query.
+    # Posts are aggregated per person in SQL (comma separated UUIDs), so each person is returned once.
+    # Persons without posts are kept (post_uuids is NULL) so their names are available for logging.
     query = """
             -- IS --
             SELECT
                 p.id as person_uuid,
-                p.given_name as first_name,
-                p.family_name as last_name,
-                post.label as post_label,
-                post.id as post_uuid
+                p.given_name as given_name,
+                p.family_name as family_name,
+                string_agg(post.id::text, ',') as post_uuids
             FROM
                 person_view p
-            JOIN
+            LEFT JOIN
                 holdspost_view hp ON p.id = hp.resource_id
-            JOIN
-                post_view post ON post.id = hp.holds_post;
+            LEFT JOIN
+                post_view post ON post.id = hp.holds_post
+            GROUP BY
+                p.id, p.given_name, p.family_name;
             """
     result_is = dataspot_client.execute_query_api(sql_query=query)
 
-    logging.info(f"Found {len(result_is)} assignments in the IS")
-
     # Convert IS and SHOULD to more usable formats for comparison: dict of person_uuid to a list of post_uuids (list)
-    is_assignments = {}
-    for assignment in result_is:
-        person_uuid = assignment['person_uuid']
-        post_uuid = assignment['post_uuid']
-        if person_uuid not in is_assignments:
-            is_assignments[person_uuid] = []
-        is_assignments[person_uuid].append(post_uuid)
+    # Also create a mapping of person_uuid to their name to use for logging
+    person_names_mapping = {
+        row['person_uuid']: (row['given_name'], row['family_name']) for row in result_is
+    }
+    is_assignments = {
+        row['person_uuid']: row['post_uuids'].split(',') for row in result_is if row['post_uuids']
+    }
+    assignment_count = sum(len(post_uuids) for post_uuids in is_assignments.values())
+
+    logging.info(f"Found {assignment_count} assignments in the IS")
 
     should_assignments = {}
     for post_uuid, person_uuid in staatskalender_post_person_mapping:
@@ -92,7 +100,10 @@ def check_3_post_assignment(
             should_assignments[person_uuid] = []
         should_assignments[person_uuid].append(post_uuid)
 
-    posts_to_consider = get_posts_with_sk_membership_ids(dataspot_client)
+    if posts_with_membership is not None:
+        posts_to_consider = posts_with_membership
+    else:
+        posts_to_consider = get_posts_with_sk_membership_ids(dataspot_client)
     validation_status_by_post = validation_status_by_post or {}
     validated_post_uuids = {
         post_uuid for post_uuid in posts_to_consider
@@ -115,20 +126,6 @@ def check_3_post_assignment(
         })
         logging.info(f"Skipping mutations for post {post_label} due to unresolved Check #2 validation")
 
-    # Create a mapping of person_uuid to their name to use for logging
-    person_names_mapping = {}
-    query = """
-            SELECT
-                p.id as person_uuid,
-                p.given_name as given_name,
-                p.family_name as family_name
-            FROM
-                person_view p
-            """
-    result_names = dataspot_client.execute_query_api(sql_query=query)
-    for name in result_names:
-        person_names_mapping[name['person_uuid']] = (name['given_name'], name['family_name'])
-
     # Process each person who has or should have posts with membership_ids
     for person_uuid in set(list(should_assignments.keys()) + list(is_assignments.keys())):
         # Get person name for logs
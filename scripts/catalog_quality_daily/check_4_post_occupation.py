@@ -43,14 +43,13 @@ def check_4_post_occupation(dataspot_client: BaseDataspotClient) -> Dict[str, an
             logging.info(f"Check finished: All posts are occupied")
             return result
         
-        # Process each unoccupied post
+        # Create an issue for each unoccupied post
         for post in unoccupied_posts:
-            post_uuid = post.get('post_uuid')
             post_label = post.get('post_label')
-            
+
             result['issues'].append({
                 'type': 'unoccupied_post',
-                'post_uuid': post_uuid,
+                'post_uuid': post.get('post_uuid'),
                 'post_label': post_label,
                 'message': f"Post {post_label} has no person assigned",
                 'remediation_attempted': False,
@@ -80,6 +79,8 @@ def get_unoccupied_posts(dataspot_client: BaseDataspotClient) -> List[Dict[str,
     """
     Get all posts without any person assigned.
     
+    Uses a LEFT JOIN anti-join instead of a correlated NOT EXISTS subquery.
+    
     Args:
         dataspot_client: Database client
         
@@ -92,12 +93,10 @@ def get_unoccupied_posts(dataspot_client: BaseDataspotClient) -> List[Dict[str,
         p.label AS post_label
     FROM 
         post_view p
+    LEFT JOIN 
+        holdspost_view h ON h.holds_post = p.id
     WHERE 
-        NOT EXISTS (
-            SELECT 1 
-            FROM holdspost_view h 
-            WHERE h.holds_post = p.id
-        )
+        h.holds_post IS NULL
     ORDER BY 
         p.label
     """
@@ -1,12 +1,23 @@
 import logging
-from typing import Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, NamedTuple
 
 import config
 from src.common import requests_patch, requests_post
 from src.clients.base_client import BaseDataspotClient
+from src.clients.helpers import get_created_asset_id
 from src.staatskalender_cache import StaatskalenderCache
 
 
+class PersonWithSkId(NamedTuple):
+    """Person with sk_person_id (without quotes) and the number of assigned posts"""
+    person_uuid: str
+    given_name: str
+    family_name: str
+    sk_person_id: str
+    posts_count: int
+
+
 def check_5_user_assignment(dataspot_client: BaseDataspotClient, staatskalender_cache: StaatskalenderCache) -> Dict[str, any]:
     """
     Check #5: Benutzerkontensynchronisation
@@ -48,41 +59,51 @@ def check_5_user_assignment(dataspot_client: BaseDataspotClient, staatskalender_
     }
     
     try:
-        # Get all persons with sk_person_id and their post assignments
-        persons_with_sk_id = get_persons_with_sk_person_id(dataspot_client)
+        # Get all persons with sk_person_id (and their post assignments) and all users from Dataspot.
+        # The two queries are independent, so they are sent concurrently.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            persons_future = executor.submit(get_persons_with_sk_person_id, dataspot_client)
+            users_future = executor.submit(get_all_users, dataspot_client)
+            persons_with_sk_id = persons_future.result()
+            users = users_future.result()
         
         if not persons_with_sk_id:
             result['message'] = 'No persons with sk_person_id found.'
             return result
             
         logging.info(f"Found {len(persons_with_sk_id)} persons with sk_person_id to verify")
-        
-        # Get all users from Dataspot
-        users = get_all_users(dataspot_client)
         logging.info(f"Found {len(users)} users in the system")
         
-        # Create lookup dictionaries for faster access
+        # Create lookup dictionaries for faster access (users by email and by linked person UUID) in a single pass
         users_by_email = {}
-        for user in users:
-            if user['email']:
-                # Always store and lookup with lowercase email
-                users_by_email[user['email'].lower()] = user
-        
-        # Create a lookup dictionary for users by person UUID
         users_by_person_uuid = {}
         for user in users:
+            email = user['email']
+            if email:
+                # Always store and lookup with lowercase email
+                users_by_email[email.lower()] = user
             person_uuid = user.get('linked_person_uuid')
             if person_uuid:
                 users_by_person_uuid[person_uuid] = user
         
+        # Load the Staatskalender persons of all persons to verify, the loop below then reads from the cache
+        staatskalender_cache.prefetch_persons(person.sk_person_id for person in persons_with_sk_id)
+        
+        # Local reference to the issues list, appended to for every finding in the loop below
+        issues = result['issues']
+        
+        # Emails (lowercase) for which creating a user failed in this run, with the error message.
+        # Creation is not retried for further persons with the same email, as each attempt goes through all retries.
+        failed_user_creations = {}
+        
         # Process each person
         for person in persons_with_sk_id:
-            person_uuid = person['person_uuid']
-            sk_person_id = person['sk_person_id'].strip('"')
-            given_name = person['given_name']
-            family_name = person['family_name']
+            person_uuid = person.person_uuid
+            sk_person_id = person.sk_person_id
+            given_name = person.given_name
+            family_name = person.family_name
             person_name = f"{given_name} {family_name}"
-            has_posts = person['posts_count'] > 0
+            has_posts = person.posts_count > 0
             
             logging.debug(f"Processing person: {person_name} (UUID: {person_uuid}) - Has posts: {has_posts}")
             
@@ -108,7 +129,7 @@ def check_5_user_assignment(dataspot_client: BaseDataspotClient, staatskalender_
                     if update_success:
                         # Log the update
                         issue_message = f"Updated person name from '{person_name}' to '{sk_first_name} {sk_last_name}'"
-                        result['issues'].append({
+                        issues.append({
                             'type': 'person_name_update',
                             'person_uuid': person_uuid,
                             'given_name': given_name,
@@ -127,7 +148,7 @@ def check_5_user_assignment(dataspot_client: BaseDataspotClient, staatskalender_
                         person_name = f"{given_name} {family_name}"
                     else:
                         issue_message = f"Failed to update person name from '{person_name}' to '{sk_first_name} {sk_last_name}'"
-                        result['issues'].append({
+                        issues.append({
                             'type': 'person_name_update_failed',
                             'person_uuid': person_uuid,
                             'given_name': given_name,
@@ -142,7 +163,7 @@ def check_5_user_assignment(dataspot_client: BaseDataspotClient, staatskalender_
             except Exception as e:
                 # If we can't retrieve person data from Staatskalender, log error and skip
                 logging.error(f"Error retrieving person data from Staatskalender for {sk_person_id}: {str(e)}")
-                result['issues'].append({
+                issues.append({
                     'type': 'person_data_retrieval_failed',
                     'person_uuid': person_uuid,
                     'given_name': given_name,
@@ -163,13 +184,13 @@ def check_5_user_assignment(dataspot_client: BaseDataspotClient, staatskalender_
                     # Only create an issue if no user exists AND person has posts
                     issue_message = f"Person {person_name} has no email address in Staatskalender. " \
                                    f"Please add an email address in Staatskalender or manually create a user account."
-                    result['issues'].append({
+                    issues.append({
                         'type': 'person_mismatch_missing_email',
                         'person_uuid': person_uuid,
                         'given_name': given_name,
                         'family_name': family_name,
                         'sk_person_id': sk_person_id,
-                        'posts_count': person['posts_count'],
+                        'posts_count': person.posts_count,
                         'message': issue_message,
                         'remediation_attempted': False,
                         'remediation_success': False
@@ -185,8 +206,11 @@ def check_5_user_assignment(dataspot_client: BaseDataspotClient, staatskalender_
                 # Skip to next person since we can't create a user without an email
                 continue
             
+            # Emails are compared in lowercase; lowercase the Staatskalender email only once per person
+            email_key = email.lower()
+            
             # Step 1: Check if user exists by email (primary method)
-            user = users_by_email.get(email.lower())
+            user = users_by_email.get(email_key)
             
             # Step 2: If not found by email, check if linked to person by UUID
             if not user:
@@ -195,26 +219,45 @@ def check_5_user_assignment(dataspot_client: BaseDataspotClient, staatskalender_
             # Step 3: If still no user, create one (EDITOR if has posts, READ_ONLY otherwise)
             if not user:
                 access_type = "EDITOR" if has_posts else "READ_ONLY"
-                logging.info(f"Person {person_name} (UUID: {person_uuid}) has no associated user account - creating one with {access_type} access")
                 
-                create_result = create_user_for_person(
-                    dataspot_client=dataspot_client,
-                    email=email,
-                    given_name=given_name,
-                    family_name=family_name,
-                    person_uuid=person_uuid,
-                    has_posts=has_posts
-                )
+                if email_key in failed_user_creations:
+                    create_result = {
+                        'success': False,
+                        'message': f"Creating a user with this email already failed in this run: {failed_user_creations[email_key]}"
+                    }
+                else:
+                    logging.info(f"Person {person_name} (UUID: {person_uuid}) has no associated user account - creating one with {access_type} access")
+                    
+                    create_result = create_user_for_person(
+                        dataspot_client=dataspot_client,
+                        email=email,
+                        given_name=given_name,
+                        family_name=family_name,
+                        person_uuid=person_uuid,
+                        has_posts=has_posts
+                    )
+                    if not create_result['success']:
+                        failed_user_creations[email_key] = create_result['message']
                 
                 if create_result['success']:
+                    # Register the new user locally so later persons with the same email or UUID don't create it again
+                    created_user = {
+                        'user_uuid': create_result['user_uuid'],
+                        'email': email_key,
+                        'access_level': create_result['access_level'],
+                        'linked_person_uuid': person_uuid
+                    }
+                    users_by_email[email_key] = created_user
+                    users_by_person_uuid[person_uuid] = created_user
+
                     issue_message = f"Successfully created user account for {person_name} with email {email} ({access_type} access)"
-                    result['issues'].append({
+                    issues.append({
                         'type': 'user_created',
                         'person_uuid': person_uuid,
                         'given_name': given_name,
                         'family_name': family_name,
                         'sk_person_id': sk_person_id,
-                        'posts_count': person['posts_count'],
+                        'posts_count': person.posts_count,
                         'user_uuid': create_result['user_uuid'],
                         'user_email': email,
                         'user_access_level': create_result['access_level'],
@@ -225,13 +268,13 @@ def check_5_user_assignment(dataspot_client: BaseDataspotClient, staatskalender_
                     logging.info(issue_message)
                 else:
                     issue_message = f"Failed to create user account for {person_name} with email {email}: {create_result['message']}"
-                    result['issues'].append({
+                    issues.append({
                         'type': 'user_creation_failed',
                         'person_uuid': person_uuid,
                         'given_name': given_name,
                         'family_name': family_name,
                         'sk_person_id': sk_person_id,
-                        'posts_count': person['posts_count'],
+                        'posts_count': person.posts_count,
                         'user_email': email,
                         'message': issue_message,
                         'remediation_attempted': True,
@@ -240,8 +283,19 @@ def check_5_user_assignment(dataspot_client: BaseDataspotClient, staatskalender_
                     logging.info(issue_message)
                 continue
             
+            # Most users are already correct: skip the remaining steps if the user is linked to the person
+            # and does not need an access level upgrade
+            is_linked = user['linked_person_uuid'] == person_uuid
+            needs_upgrade = has_posts and user['access_level'] == 'READ_ONLY'
+            if is_linked and not needs_upgrade:
+                logging.debug(f"User {user['email']} is correctly set up for person {person_name}")
+                continue
+            
+            # Set to True if the access level is upgraded together with the person link in step 4
+            access_level_upgraded_with_link = False
+            
             # Step 4: User exists but may not be correctly linked to the person
-            if user['linked_person_uuid'] != person_uuid:
+            if not is_linked:
                 logging.info(f"User {user['email']} exists but is not linked to person {person_name} - fixing link")
                 
                 # Get user API endpoint
@@ -254,14 +308,19 @@ def check_5_user_assignment(dataspot_client: BaseDataspotClient, staatskalender_
                     "isPerson": f"{family_name}, {given_name}"
                 }
                 
+                # If the access level has to be upgraded as well (step 5), send it in the same request
+                if needs_upgrade:
+                    payload['accessLevel'] = 'EDITOR'
+                
                 # Send API request to update the user
                 try:
                     response = requests_patch(url=api_url, json=payload, headers=dataspot_client.auth.get_headers())
                     
                     if response.status_code == 200:
+                        access_level_upgraded_with_link = needs_upgrade
                         logging.info(f"Successfully linked user {user['email']} to person {person_name}")
                         issue_message = f"User {user['email']} is now correctly linked to person {person_name}"
-                        result['issues'].append({
+                        issues.append({
                             'type': 'user_person_link_updated',
                             'person_uuid': person_uuid,
                             'given_name': given_name,
@@ -274,11 +333,18 @@ def check_5_user_assignment(dataspot_client: BaseDataspotClient, staatskalender_
                             'remediation_success': True
                         })
                         logging.info(issue_message)
+                        
+                        # Keep the lookup by person UUID in line with the new link for the persons processed later
+                        previous_person_uuid = user['linked_person_uuid']
+                        if previous_person_uuid and users_by_person_uuid.get(previous_person_uuid) is user:
+                            del users_by_person_uuid[previous_person_uuid]
+                        user['linked_person_uuid'] = person_uuid
+                        users_by_person_uuid[person_uuid] = user
                     else:
                         logging.error(f"Failed to link user to person. Status code: {response.status_code}")
                         logging.error(f"Response: {response.text}")
                         issue_message = f"Failed to link user {user['email']} to person {person_name}"
-                        result['issues'].append({
+                        issues.append({
                             'type': 'user_person_link_update_failed',
                             'person_uuid': person_uuid,
                             'given_name': given_name,
@@ -294,7 +360,7 @@ def check_5_user_assignment(dataspot_client: BaseDataspotClient, staatskalender_
                 except Exception as e:
                     logging.error(f"Exception while linking user to person: {str(e)}", exc_info=True)
                     issue_message = f"Exception while linking user {user['email']} to person {person_name}: {str(e)}"
-                    result['issues'].append({
+                    issues.append({
                         'type': 'user_person_link_update_failed',
                         'person_uuid': person_uuid,
                         'given_name': given_name,
@@ -310,10 +376,11 @@ def check_5_user_assignment(dataspot_client: BaseDataspotClient, staatskalender_
             
             # Step 5: Check if user has correct access level (if person has posts)
             # Note: Only upgrade READ_ONLY to EDITOR. ADMINISTRATOR users are intentionally never modified.
-            if has_posts and user['access_level'] == 'READ_ONLY':
+            if needs_upgrade:
                 logging.debug(f"User {user['email']} has READ_ONLY access but person {person_name} has posts - upgrading to EDITOR")
                 
-                update_success = update_user_access_level(
+                # Only send a separate request if the upgrade was not already part of the link update in step 4
+                update_success = access_level_upgraded_with_link or update_user_access_level(
                     dataspot_client=dataspot_client,
                     user_uuid=user['user_uuid'],
                     access_level='EDITOR'
@@ -321,7 +388,7 @@ def check_5_user_assignment(dataspot_client: BaseDataspotClient, staatskalender_
                 
                 if update_success:
                     issue_message = f"Updated access level for user {user['email']} from READ_ONLY to EDITOR"
-                    result['issues'].append({
+                    issues.append({
                         'type': 'access_level_updated',
                         'person_uuid': person_uuid,
                         'given_name': given_name,
@@ -337,9 +404,12 @@ def check_5_user_assignment(dataspot_client: BaseDataspotClient, staatskalender_
                     })
                     logging.info(f"Successfully updated user access level from READ_ONLY to EDITOR for {user['email']} (Person {given_name} {family_name})")
                     logging.info(issue_message)
+                    
+                    # Another person with the same user (e.g. a duplicate) must not upgrade it again
+                    user['access_level'] = 'EDITOR'
                 else:
                     issue_message = f"Failed to update access level for user {user['email']} from READ_ONLY to EDITOR"
-                    result['issues'].append({
+                    issues.append({
                         'type': 'access_level_update_failed',
                         'person_uuid': person_uuid,
                         'given_name': given_name,
@@ -399,12 +469,15 @@ def check_5_user_assignment(dataspot_client: BaseDataspotClient, staatskalender_
     return result
 
 
-def get_persons_with_sk_person_id(dataspot_client: BaseDataspotClient) -> List[Dict[str, any]]:
+def get_persons_with_sk_person_id(dataspot_client: BaseDataspotClient) -> List[PersonWithSkId]:
     """
     Get all persons with sk_person_id and count their assigned posts.
+
+    Persons with an empty sk_person_id (also '""', as custom properties are stored JSON-encoded) are
+    filtered out in the join already, so the posts are only joined and counted for relevant persons.
         
     Returns:
-        List of dicts with person info and post count
+        List of PersonWithSkId tuples with person info and post count
     """
     query = """
     SELECT 
@@ -416,7 +489,10 @@ def get_persons_with_sk_person_id(dataspot_client: BaseDataspotClient) -> List[D
     FROM 
         person_view p
     JOIN
-        customproperties_view cp ON p.id = cp.resource_id AND cp.name = 'sk_person_id'
+        customproperties_view cp ON p.id = cp.resource_id
+            AND cp.name = 'sk_person_id'
+            AND cp.value IS NOT NULL
+            AND TRIM(BOTH '"' FROM cp.value) <> ''
     LEFT JOIN
         holdspost_view hp ON p.id = hp.resource_id
     GROUP BY
@@ -424,7 +500,16 @@ def get_persons_with_sk_person_id(dataspot_client: BaseDataspotClient) -> List[D
     ORDER BY
         p.family_name, p.given_name
     """
-    return dataspot_client.execute_query_api(sql_query=query)
+    return [
+        PersonWithSkId(
+            person_uuid=row['person_uuid'],
+            given_name=row['given_name'],
+            family_name=row['family_name'],
+            sk_person_id=row['sk_person_id'].strip('"'),
+            posts_count=row['posts_count']
+        )
+        for row in dataspot_client.execute_query_api(sql_query=query)
+    ]
 
 
 def get_all_users(dataspot_client: BaseDataspotClient) -> List[Dict[str, any]]:
@@ -551,8 +636,8 @@ def create_user_for_person(dataspot_client: BaseDataspotClient, email: str, give
         )
         
         if response.status_code in [200, 201]:  # 200 OK or 201 Created
-            user_data = response.json()
-            user_uuid = user_data.get('id')
+            # Read the id from the response body, or from the Location header if the body has none
+            user_uuid = get_created_asset_id(response)
             result['success'] = True
             result['user_uuid'] = user_uuid
             result['message'] = f"Successfully created user {email} with access level {access_level}"
@@ -5,6 +5,7 @@ from typing import Dict, List, Tuple, Any, Optional
 import config
 from src.common import requests_patch
 from src.clients.base_client import BaseDataspotClient
+from src.clients.helpers import strip_quotes
 from src.staatskalender_cache import StaatskalenderCache
 
 # Global cache for person data (Dataspot database caches, not Staatskalender)
@@ -68,8 +69,9 @@ def check_6_person_contact_details(dataspot_client: BaseDataspotClient, staatska
 
             logging.info(f"[{current_idx}/{total_persons}] {person_name}:")
             
-            # Add delay to prevent overwhelming the API
-            time.sleep(1)
+            # Add delay to prevent overwhelming the API (not needed if no request is made)
+            if not staatskalender_cache.is_person_cached(sk_person_id):
+                time.sleep(1)
             
             # Get person data from Staatskalender cache
             try:
@@ -220,9 +222,9 @@ def get_persons_with_contact_details(dataspot_client: BaseDataspotClient) -> Lis
     
     for result in results:
         # Strip quotes from string values
-        given_name = (result.get('given_name') or '').strip('"').strip()
-        additional_name = (result.get('additional_name') or '').strip('"').strip() if result.get('additional_name') else ''
-        family_name = (result.get('family_name') or '').strip('"').strip()
+        given_name = (strip_quotes(result.get('given_name')) or '').strip()
+        additional_name = (strip_quotes(result.get('additional_name')) or '').strip()
+        family_name = (strip_quotes(result.get('family_name')) or '').strip()
 
         # given_name and family_name are mandatory; abort loudly if missing
         if not given_name or not family_name:
@@ -234,10 +236,10 @@ def get_persons_with_contact_details(dataspot_client: BaseDataspotClient) -> Lis
             'family_name': family_name,
             'additional_name': additional_name if additional_name else None,
             'sk_person_id': result['sk_person_id'],
-            'email_custom_property': result.get('email_custom_property', '').strip('"') if result.get('email_custom_property') else None,
-            'phone': result.get('phone', '').strip('"') if result.get('phone') else None,
-            'state_calendar_website': result.get('state_calendar_website', '').strip('"') if result.get('state_calendar_website') else None,
-            'teams': result.get('teams', '').strip('"') if result.get('teams') else None
+            'email_custom_property': strip_quotes(result.get('email_custom_property')),
+            'phone': strip_quotes(result.get('phone')),
+            'state_calendar_website': strip_quotes(result.get('state_calendar_website')),
+            'teams': strip_quotes(result.get('teams'))
         }
         _contact_details_cache.append(person_data)
     
@@ -3,7 +3,7 @@ import logging
 import os
 import requests
 
-from src.common import requests_get
+from src.common import requests_get, HTTP_DOWNLOAD_TIMEOUT_SEC
 from src.clients.base_client import BaseDataspotClient
 
 
@@ -69,7 +69,9 @@ def check_7_yaml(dataspot_client: BaseDataspotClient) -> dict:
             try:
                 # Download online version
                 download_url = f"{config.base_url}/api/{config.database_name_prod}/profiles/{online_name}/download"
-                response = requests_get(download_url, headers=dataspot_client.auth.get_headers())
+                response = requests_get(
+                    download_url, headers=dataspot_client.auth.get_headers(), timeout=HTTP_DOWNLOAD_TIMEOUT_SEC
+                )
                 response.raise_for_status()
                 online_content = response.text
 
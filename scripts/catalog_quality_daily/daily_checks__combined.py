@@ -58,6 +58,7 @@ def run_all_checks():
 
     staatskalender_post_person_mapping = []
     validation_status_by_post = {}
+    posts_with_membership = None
 
     if run_check_1:
         # Check #1: Unique sk_person_id verification
@@ -99,6 +100,7 @@ def run_all_checks():
         })
         staatskalender_post_person_mapping = check_2_result['staatskalender_post_person_mapping']
         validation_status_by_post = check_2_result.get('validation_status_by_post', {})
+        posts_with_membership = check_2_result.get('posts_with_membership')
 
         logging.info("")
         logging.info("   Check #2: Person Assignment (Staatskalender) Completed.")
@@ -121,7 +123,8 @@ def run_all_checks():
         result = check_3_post_assignment(
             dataspot_client=dataspot_base_client,
             staatskalender_post_person_mapping=staatskalender_post_person_mapping,
-            validation_status_by_post=validation_status_by_post
+            validation_status_by_post=validation_status_by_post,
+            posts_with_membership=posts_with_membership
         )
         check_results.append({
             'check_name': 'check_3_post_assignment',
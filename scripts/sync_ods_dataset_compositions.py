@@ -3,7 +3,6 @@ import json
 import os
 import datetime
 import time
-import traceback
 
 import config
 from src.clients.tdm_client import TDMClient
@@ -400,9 +399,7 @@ def sync_ods_dataset_compositions(max_datasets: int = None, batch_size: int = 50
     except Exception as e:
         # Capture error information
         error_message = str(e)
-        error_traceback = traceback.format_exc()
-        logging.error(f"Exception occurred during synchronization: {error_message}")
-        logging.error(f"Traceback: {error_traceback}")
+        logging.error(f"Exception occurred during synchronization: {error_message}", exc_info=True)
         
         # Update the sync_results with error status
         sync_results['status'] = 'error'
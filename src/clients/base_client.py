@@ -6,7 +6,8 @@ from urllib.parse import quote
 import config
 from src.dataspot_auth import DataspotAuth
 from src.common import requests_get, requests_delete, requests_delete_no_retry, requests_post, requests_put, requests_patch
-from src.clients.helpers import url_join
+from src.common import HTTP_DOWNLOAD_TIMEOUT_SEC, HTTP_BULK_UPLOAD_TIMEOUT_SEC
+from src.clients.helpers import url_join, sql_string_literal
 
 from requests import HTTPError
 
@@ -26,6 +27,7 @@ class BaseDataspotClient:
        parameter applied to all assets in the operation.
     """
     _system_uuid_by_label_cache: Dict[str, str] = {}
+    _organization_uuid_by_name_cache: Dict[str, str] = {}
 
     def __init__(self, scheme_name: str, scheme_name_short: str,
                  ods_imports_collection_name: str = None, ods_imports_collection_path: List[str] = None):
@@ -83,6 +85,10 @@ class BaseDataspotClient:
             headers=self.auth.get_headers()
         )
 
+        # requests already asks for a compressed response (Accept-Encoding: gzip, deflate) and decodes it
+        logging.debug(f"Query API response: {len(response.content)} bytes, "
+                      f"Content-Encoding: {response.headers.get('Content-Encoding', 'none')}")
+
         return response.json()
 
     def resolve_system_uuid_by_label(self, label: str) -> str:
@@ -135,7 +141,7 @@ class BaseDataspotClient:
         download_url = f"{config.base_url}/api/{config.database_name}/schemes/{self.scheme_name}/download?format=JSON&assetTypes=Collection"
         
         logging.debug(f"Downloading all Collections from scheme '{self.scheme_name}' at: {download_url}")
-        response = requests_get(download_url, headers=self.auth.get_headers())
+        response = requests_get(download_url, headers=self.auth.get_headers(), timeout=HTTP_DOWNLOAD_TIMEOUT_SEC)
         response.raise_for_status()
         
         all_assets = response.json()
@@ -658,7 +664,8 @@ class BaseDataspotClient:
         response = requests_put(
             full_url,
             headers=headers,
-            files=files
+            files=files,
+            timeout=HTTP_BULK_UPLOAD_TIMEOUT_SEC
         )
 
         # Raise HTTPError for bad responses
@@ -698,14 +705,15 @@ class BaseDataspotClient:
                 
         return result
 
-    def ensure_person_exists(self, first_name: str, last_name: str) -> (str, bool):
+    def ensure_person_exists(self, first_name: str, last_name: str, sk_person_id: str = None) -> (str, bool):
         """
         Ensures that a person exists in the Dataspot database. If the person doesn't exist,
-        creates them using just the first and last name.
+        creates them using the first and last name (and the sk_person_id, if given).
 
         Args:
             first_name: First name of the person
             last_name: Last name of the person
+            sk_person_id: Optional. Staatskalender person ID to set when the person is created
 
         Returns:
             str: The uuid of the existing or newly created person
@@ -716,44 +724,38 @@ class BaseDataspotClient:
         """
         logging.info(f"Ensuring person exists: {first_name} {last_name}")
 
-        # Get all persons from the database
-        persons_endpoint = f"/rest/{config.database_name}/persons/"
-        response = requests_get(
-            url=url_join(config.base_url, persons_endpoint),
-            headers=self.auth.get_headers()
-        )
-        response.raise_for_status()
-
-        # Check response structure - could be a list or embedded in _embedded.persons
-        response_json = response.json()
-        if '_embedded' in response_json and 'persons' in response_json['_embedded']:
-            persons = response_json['_embedded']['persons']
-        elif isinstance(response_json, list):
-            persons = response_json
-        else:
-            logging.warning(f"Unexpected response format from persons endpoint: {response_json}")
-            persons = []
-
-        # Look for existing person by name
-        for person in persons:
-            # Match by first and last name
-            if person.get('familyName') == last_name and person.get('givenName') == first_name:
-                logging.info(f"Found existing person: {person.get('familyName')} {person.get('givenName')} (id: {person.get('id')})")
-                person_uuid = person['id']
-                newly_created = False
-                return person_uuid, newly_created
+        # Look for existing person by first and last name (filtered by the Query API instead of loading all persons)
+        query = f"""
+            SELECT
+                p.id
+            FROM
+                person_view p
+            WHERE
+                p.given_name = {sql_string_literal(first_name)}
+                AND p.family_name = {sql_string_literal(last_name)}
+            LIMIT 1
+        """
+        persons = self.execute_query_api(sql_query=query)
+        if persons:
+            person_uuid = persons[0]['id']
+            logging.info(f"Found existing person: {last_name} {first_name} (id: {person_uuid})")
+            newly_created = False
+            return person_uuid, newly_created
 
         # Person doesn't exist, create it
         logging.info(f"Person not found, creating new: {first_name} {last_name}")
 
-        # Determine Data Excellence UUID
-        dx_response = requests_get(f"{config.base_url}/rest/{config.database_name}/organizations/{config.organizations_name}",
-                                   headers=self.auth.get_headers())
+        # Determine Data Excellence UUID (only requested once per run, as it does not change)
+        dx_organization_uuid = BaseDataspotClient._organization_uuid_by_name_cache.get(config.organizations_name)
+        if not dx_organization_uuid:
+            dx_response = requests_get(f"{config.base_url}/rest/{config.database_name}/organizations/{config.organizations_name}",
+                                       headers=self.auth.get_headers())
 
-        dx_response.raise_for_status()
-        dx_response_json = dx_response.json()
+            dx_response.raise_for_status()
+            dx_response_json = dx_response.json()
 
-        dx_organization_uuid = dx_response_json['id']
+            dx_organization_uuid = dx_response_json['id']
+            BaseDataspotClient._organization_uuid_by_name_cache[config.organizations_name] = dx_organization_uuid
 
         # Prepare person data
         person_data = {
@@ -762,6 +764,11 @@ class BaseDataspotClient:
             "givenName": first_name,
             "agentOf": dx_organization_uuid
         }
+        if sk_person_id:
+            # Set the sk_person_id with the creation instead of a separate update afterwards
+            person_data["customProperties"] = {
+                "sk_person_id": sk_person_id
+            }
 
         # Create the person
         create_endpoint = f"/rest/{config.database_name}/persons"
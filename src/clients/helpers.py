@@ -109,6 +109,22 @@ def strip_quotes(value: str | None) -> str | None:
     return value
 
 
+def sql_string_literal(value: str) -> str:
+    """
+    Render a value as SQL string literal for queries sent to the Query API.
+
+    The Query API does not support bound parameters, so values are embedded in the SQL text.
+    Single quotes are doubled, so the value cannot end the literal early.
+
+    Args:
+        value: The value to embed
+
+    Returns:
+        str: The quoted SQL string literal (e.g. "O'Brien" -> "'O''Brien'")
+    """
+    return "'" + value.replace("'", "''") + "'"
+
+
 def decode_query_api_custom_property(value: str | None) -> str | None:
     """
     Decode custom-property values returned via Query API.
@@ -179,6 +195,34 @@ def normalize_multiline_markdown(value: str | None) -> str | None:
     return normalized if normalized else None
 
 
+def get_created_asset_id(response) -> str | None:
+    """
+    Extract the id of a newly created asset from a create (POST) response.
+
+    The id is read from the response body. If the body is empty or has no id,
+    the last segment of the Location header is used instead.
+
+    Args:
+        response: The HTTP response of the create request
+
+    Returns:
+        str: The id of the created asset, or None if it cannot be determined
+    """
+    try:
+        body = response.json()
+    except ValueError:
+        body = None
+
+    if isinstance(body, dict) and body.get('id'):
+        return body['id']
+
+    location = response.headers.get('Location', '').rstrip('/')
+    if location:
+        return location.rsplit('/', 1)[-1]
+
+    return None
+
+
 def prepare_custom_property_for_form(value: str | None) -> str:
     """
     Parse query-api value and render it user-friendly in form fields.
@@ -5,7 +5,7 @@ from urllib.parse import quote
 import config
 from src.clients.base_client import BaseDataspotClient
 from src.clients.helpers import url_join
-from src.common import requests_get, requests_post
+from src.common import requests_get, requests_post, HTTP_DOWNLOAD_TIMEOUT_SEC
 
 
 class LAWClient(BaseDataspotClient):
@@ -47,7 +47,7 @@ class LAWClient(BaseDataspotClient):
             f"{config.base_url}/api/{config.database_name}/collections/"
             f"{collection_uuid}/download?format=JSON"
         )
-        response = requests_get(download_url, headers=self.auth.get_headers())
+        response = requests_get(download_url, headers=self.auth.get_headers(), timeout=HTTP_DOWNLOAD_TIMEOUT_SEC)
         response.raise_for_status()
         assets = response.json()
         if not isinstance(assets, list):
@@ -7,6 +7,8 @@ It includes:
 - Automatic retry logic for various HTTP/network errors
 - Rate limiting to prevent server overload (this is the only module that handles rate limiting)
 - Proxy support via environment variables
+- Connection reuse (HTTP keep-alive) through a shared, pooled session
+- Default connect and read timeouts for all requests
 - Detailed error message parsing and logging
 - Support for all common HTTP methods (GET, POST, PUT, PATCH, DELETE)
 - Custom DetailedHTTPError exception that preserves detailed error information from API responses
@@ -17,6 +19,7 @@ When errors occur, the functions raise DetailedHTTPError exceptions that contain
 from the API response, including violations and specific error messages, rather than generic HTTP error messages.
 """
 
+import http.cookiejar
 import json
 import logging
 import os
@@ -26,6 +29,7 @@ from json import JSONDecodeError
 import urllib3
 import ssl
 import requests
+from requests.adapters import HTTPAdapter
 
 from urllib3.exceptions import HTTPError
 
@@ -42,6 +46,45 @@ if MAX_RETRIES_FOR_PROD:
 else:
     MAX_RETRIES = 4
 
+# Default (connect, read) timeout in seconds, so that a hanging connection cannot stall a run forever.
+# Regular Dataspot and Staatskalender calls answer within seconds; the read timeout leaves room for
+# Query API results. Can be overridden per request.
+HTTP_TIMEOUT_SEC = (10, 120)
+
+# (connect, read) timeout for Download API exports (whole schemes, collections, profiles), which can take several minutes
+HTTP_DOWNLOAD_TIMEOUT_SEC = (10, 600)
+
+# (connect, read) timeout for bulk imports (upload of many assets at once), which can take several minutes
+HTTP_BULK_UPLOAD_TIMEOUT_SEC = (10, 600)
+
+# Number of pooled connections kept alive per host
+HTTP_POOL_MAXSIZE = 20
+
+# Shared session so that consecutive requests to the same host (Dataspot, Staatskalender) reuse the
+# TCP/TLS connection instead of doing a new handshake per call. Retries are handled by the @retry
+# decorator below, so the adapter itself does not retry.
+# The session is shared by all clients (and threads), so it must not keep cookies: a cookie set for one
+# client (e.g. a Dataspot session cookie) would otherwise be sent along with the requests of every other one.
+_session = requests.Session()
+_session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+_session.mount('https://', HTTPAdapter(pool_connections=HTTP_POOL_MAXSIZE, pool_maxsize=HTTP_POOL_MAXSIZE))
+_session.mount('http://', HTTPAdapter(pool_connections=HTTP_POOL_MAXSIZE, pool_maxsize=HTTP_POOL_MAXSIZE))
+
+
+def get_session() -> requests.Session:
+    """
+    Return the shared, pooled session.
+
+    Meant for calls that need the raw response without retries, rate limiting or error parsing
+    (e.g. token requests that handle 401 themselves), so that they still reuse pooled connections.
+    The session keeps no cookies, so credentials sent through it are not carried over to other requests.
+
+    Returns:
+        requests.Session: The session used by all request wrappers of this module
+    """
+    return _session
+
+
 class DetailedHTTPError(requests.exceptions.HTTPError):
     """Custom HTTPError that includes detailed error information from the response."""
     
@@ -86,6 +129,13 @@ http_errors_to_handle = (
     requests.Timeout,
 )
 
+# POST and PATCH are not idempotent: after a read timeout, the server may already have applied the request,
+# so retrying could e.g. create the same asset twice. These methods are only retried for errors that
+# guarantee the request was not applied (no connection) or that the server rejected it (HTTP errors).
+http_errors_to_handle_non_idempotent = tuple(
+    error for error in http_errors_to_handle if error not in (requests.ReadTimeout, requests.Timeout)
+)
+
 def _get_detailed_error_info(response: requests.Response, silent_status_codes: list = None) -> dict:
     """
     Parse and return detailed error information from a response.
@@ -106,7 +156,9 @@ def _get_detailed_error_info(response: requests.Response, silent_status_codes: l
         return {}
         
     try:
-        error_message_detailed = json.loads(response.content.decode(response.apparent_encoding))
+        # Parse the raw bytes directly; json detects the UTF encoding itself, which avoids the costly
+        # charset detection over the whole body that response.apparent_encoding does
+        error_message_detailed = json.loads(response.content)
         
         # Log the error information
         try:
@@ -128,7 +180,7 @@ def _get_detailed_error_info(response: requests.Response, silent_status_codes: l
         
         return error_message_detailed
 
-    except (JSONDecodeError, HTTPError):
+    except (JSONDecodeError, UnicodeDecodeError, HTTPError):
         # If we can't parse the JSON, return a basic error structure
         basic_error = {
             'message': f"Cannot perform {response.request.method} because '{response.reason}' for url {response.url}",
@@ -145,8 +197,9 @@ def requests_get(*args, **kwargs):
     delay = kwargs.pop('rate_limit_delay', RATE_LIMIT_DELAY_SEC)
     silent_status_codes = kwargs.pop('silent_status_codes', None)
     skip_sleep = kwargs.pop('skip_sleep', False)
+    kwargs.setdefault('timeout', HTTP_TIMEOUT_SEC)
     
-    r = requests.get(*args, **kwargs)
+    r = _session.get(*args, **kwargs)
 
     # Get detailed error information
     detailed_error_info = _get_detailed_error_info(r, silent_status_codes)
@@ -161,14 +214,15 @@ def requests_get(*args, **kwargs):
     return r
 
 
-@retry(http_errors_to_handle, tries=MAX_RETRIES, delay=1, backoff=2)
+@retry(http_errors_to_handle_non_idempotent, tries=MAX_RETRIES, delay=1, backoff=2)
 def requests_post(*args, **kwargs):
     # Extract parameters
     delay = kwargs.pop('rate_limit_delay', RATE_LIMIT_DELAY_SEC)
     silent_status_codes = kwargs.pop('silent_status_codes', None)
     skip_sleep = kwargs.pop('skip_sleep', False)
+    kwargs.setdefault('timeout', HTTP_TIMEOUT_SEC)
     
-    r = requests.post(*args, **kwargs)
+    r = _session.post(*args, **kwargs)
     
     # Get detailed error information
     detailed_error_info = _get_detailed_error_info(r, silent_status_codes)
@@ -188,8 +242,9 @@ def requests_post_no_retry(*args, **kwargs):
     delay = kwargs.pop('rate_limit_delay', RATE_LIMIT_DELAY_SEC)
     silent_status_codes = kwargs.pop('silent_status_codes', None)
     skip_sleep = kwargs.pop('skip_sleep', False)
+    kwargs.setdefault('timeout', HTTP_TIMEOUT_SEC)
 
-    r = requests.post(*args, **kwargs)
+    r = _session.post(*args, **kwargs)
     detailed_error_info = _get_detailed_error_info(r, silent_status_codes)
 
     if r.status_code not in [200, 201, 204] and r.status_code not in (silent_status_codes or []):
@@ -200,14 +255,15 @@ def requests_post_no_retry(*args, **kwargs):
     return r
 
 
-@retry(http_errors_to_handle, tries=MAX_RETRIES, delay=1, backoff=2)
+@retry(http_errors_to_handle_non_idempotent, tries=MAX_RETRIES, delay=1, backoff=2)
 def requests_patch(*args, **kwargs):
     # Extract parameters
     delay = kwargs.pop('rate_limit_delay', RATE_LIMIT_DELAY_SEC)
     silent_status_codes = kwargs.pop('silent_status_codes', None)
     skip_sleep = kwargs.pop('skip_sleep', False)
+    kwargs.setdefault('timeout', HTTP_TIMEOUT_SEC)
     
-    r = requests.patch(*args, **kwargs)
+    r = _session.patch(*args, **kwargs)
     
     # Get detailed error information
     detailed_error_info = _get_detailed_error_info(r, silent_status_codes)
@@ -227,8 +283,9 @@ def requests_patch_no_retry(*args, **kwargs):
     delay = kwargs.pop('rate_limit_delay', RATE_LIMIT_DELAY_SEC)
     silent_status_codes = kwargs.pop('silent_status_codes', None)
     skip_sleep = kwargs.pop('skip_sleep', False)
+    kwargs.setdefault('timeout', HTTP_TIMEOUT_SEC)
 
-    r = requests.patch(*args, **kwargs)
+    r = _session.patch(*args, **kwargs)
     detailed_error_info = _get_detailed_error_info(r, silent_status_codes)
 
     if r.status_code not in [200, 201, 204] and r.status_code not in (silent_status_codes or []):
@@ -245,8 +302,9 @@ def requests_put(*args, **kwargs):
     delay = kwargs.pop('rate_limit_delay', RATE_LIMIT_DELAY_SEC)
     silent_status_codes = kwargs.pop('silent_status_codes', None)
     skip_sleep = kwargs.pop('skip_sleep', False)
+    kwargs.setdefault('timeout', HTTP_TIMEOUT_SEC)
     
-    r = requests.put(*args, **kwargs)
+    r = _session.put(*args, **kwargs)
     
     # Get detailed error information
     detailed_error_info = _get_detailed_error_info(r, silent_status_codes)
@@ -265,8 +323,9 @@ def requests_put_no_retry(*args, **kwargs):
     delay = kwargs.pop('rate_limit_delay', RATE_LIMIT_DELAY_SEC)
     silent_status_codes = kwargs.pop('silent_status_codes', None)
     skip_sleep = kwargs.pop('skip_sleep', False)
+    kwargs.setdefault('timeout', HTTP_TIMEOUT_SEC)
 
-    r = requests.put(*args, **kwargs)
+    r = _session.put(*args, **kwargs)
     detailed_error_info = _get_detailed_error_info(r, silent_status_codes)
 
     if r.status_code not in [200, 201, 204] and r.status_code not in (silent_status_codes or []):
@@ -283,8 +342,9 @@ def requests_delete(*args, **kwargs):
     delay = kwargs.pop('rate_limit_delay', RATE_LIMIT_DELAY_SEC)
     silent_status_codes = kwargs.pop('silent_status_codes', None)
     skip_sleep = kwargs.pop('skip_sleep', False)
+    kwargs.setdefault('timeout', HTTP_TIMEOUT_SEC)
     
-    r = requests.delete(*args, **kwargs)
+    r = _session.delete(*args, **kwargs)
     
     # Get detailed error information
     detailed_error_info = _get_detailed_error_info(r, silent_status_codes)
@@ -303,8 +363,9 @@ def requests_delete_no_retry(*args, **kwargs):
     delay = kwargs.pop('rate_limit_delay', RATE_LIMIT_DELAY_SEC)
     silent_status_codes = kwargs.pop('silent_status_codes', None)
     skip_sleep = kwargs.pop('skip_sleep', False)
+    kwargs.setdefault('timeout', HTTP_TIMEOUT_SEC)
 
-    r = requests.delete(*args, **kwargs)
+    r = _session.delete(*args, **kwargs)
     detailed_error_info = _get_detailed_error_info(r, silent_status_codes)
 
     if r.status_code not in [200, 201, 204] and r.status_code not in (silent_status_codes or []):
@@ -1,7 +1,40 @@
 from functools import wraps
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import time
 import logging
 
+# Status codes for which the server may ask us to wait via the Retry-After header
+RETRY_AFTER_STATUS_CODES = (429, 503)
+
+# Upper bound for the wait requested via Retry-After, so that a misbehaving server cannot stall a run for hours
+RETRY_AFTER_MAX_SEC = 300
+
+
+def _retry_after_seconds(e):
+    """Return the delay in seconds requested by the Retry-After header of a failed response, or None.
+
+    The header may be given in seconds or as HTTP date. The delay is capped at RETRY_AFTER_MAX_SEC.
+    """
+    response = getattr(e, 'response', None)
+    if response is None or response.status_code not in RETRY_AFTER_STATUS_CODES:
+        return None
+    retry_after = response.headers.get('Retry-After')
+    if retry_after is None:
+        return None
+    try:
+        seconds = float(retry_after)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            # Unparseable header; use the regular backoff
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0), RETRY_AFTER_MAX_SEC)
+
 # Source: https://github.com/saltycrane/retry-decorator/blob/master/retry_decorator.py
 # BSD license: https://github.com/saltycrane/retry-decorator/blob/master/LICENSE
 def retry(ExceptionToCheck, tries=4, delay=3, backoff=2, logger=None):
@@ -32,12 +65,15 @@ def retry(ExceptionToCheck, tries=4, delay=3, backoff=2, logger=None):
                 try:
                     return f(*args, **kwargs)
                 except ExceptionToCheck as e:
-                    msg = "%s, Retrying in %d seconds..." % (str(e), mdelay)
+                    # Wait at least as long as the server asks for when it rejects us (rate limit, overload)
+                    retry_after = _retry_after_seconds(e)
+                    wait = max(mdelay, retry_after) if retry_after is not None else mdelay
+                    msg = "%s, Retrying in %d seconds..." % (str(e), wait)
                     if logger:
                         logger.warning(msg)
                     else:
                         print(msg)
-                    time.sleep(mdelay)
+                    time.sleep(wait)
                     mtries -= 1
                     mdelay *= backoff
             return f(*args, **kwargs)
@@ -1,9 +1,10 @@
 import os
 import requests
 import logging
+import threading
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
-from src.common import requests_get
+from src.common import requests_get, get_session, HTTP_TIMEOUT_SEC
 import config
 
 
@@ -27,6 +28,7 @@ class DataspotAuth:
         # Token caching
         self.token = None
         self.token_expires_at = None
+        self._token_lock = threading.Lock()
 
         self._validate_access_key()
 
@@ -35,7 +37,11 @@ class DataspotAuth:
         if self._is_token_valid():
             return self.token
 
-        return self._request_new_bearer_token()
+        # Only one thread requests a new token when requests are made in parallel
+        with self._token_lock:
+            if self._is_token_valid():
+                return self.token
+            return self._request_new_bearer_token()
 
     def _is_token_valid(self):
         """Check if the current token is still valid."""
@@ -54,7 +60,7 @@ class DataspotAuth:
         }
 
         try:
-            response_bearer = requests.post(self.token_url, data=data)
+            response_bearer = get_session().post(self.token_url, data=data, timeout=HTTP_TIMEOUT_SEC)
             response_bearer.raise_for_status()
 
             token_data = response_bearer.json()
@@ -86,7 +92,7 @@ class DataspotAuth:
         """
         # Make a simple test request - /tenants/Mandant should always work
         test_url = f"{config.base_url}/rest/{config.database_name}/tenants/Mandant"
-        r = requests.get(url=test_url, headers=self.get_headers())
+        r = get_session().get(url=test_url, headers=self.get_headers(), timeout=HTTP_TIMEOUT_SEC)
 
         if r.status_code == 401:
             logging.error("\n" + "!" * 80)
@@ -13,7 +13,7 @@ from datetime import datetime, timedelta
 import requests
 from dotenv import load_dotenv
 
-from src.common import requests_get
+from src.common import requests_get, get_session, HTTP_TIMEOUT_SEC
 
 
 # ---------------------------------------------------------------------------
@@ -59,7 +59,7 @@ class KdmAuth:
         if self.scope:
             data["scope"] = self.scope
 
-        response = requests.post(self.token_url, data=data)
+        response = get_session().post(self.token_url, data=data, timeout=HTTP_TIMEOUT_SEC)
         response.raise_for_status()
         token_data = response.json()
         self.token = token_data["access_token"]
@@ -1,10 +1,14 @@
 import os
 import logging
-from typing import Dict, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
 
 from dotenv import load_dotenv
 from requests.auth import HTTPBasicAuth
 from src.common import requests_get
+import config
 
 class StaatskalenderCache:
     """
@@ -12,7 +16,29 @@ class StaatskalenderCache:
     
     This class provides cached access to Staatskalender data, avoiding redundant
     API calls. All API errors propagate after retries are exhausted (fail-fast behavior).
+    Failed membership and person lookups are remembered as well (by their error message), so an ID that
+    occurs multiple times is not retried against the API again within the same run.
+
+    Memberships and persons can be prefetched concurrently with prefetch_memberships()
+    and prefetch_persons() before they are processed one by one. Every request still goes through requests_get, so
+    retries apply as usual. The rate limit delay of requests_get applies per worker, so the prefetch workers
+    additionally share one limiter that starts at most one lookup every PREFETCH_REQUEST_INTERVAL_SEC overall.
     """
+    # Number of parallel requests used by prefetch_memberships() and prefetch_persons()
+    PREFETCH_MAX_WORKERS = config.staatskalender_prefetch_max_workers
+
+    # Minimum time between two prefetch lookups, shared by all workers
+    PREFETCH_REQUEST_INTERVAL_SEC = config.staatskalender_prefetch_request_interval_sec
+
+    # Minimum time between two membership lookups (same spacing as the membership lookups in check #2)
+    MEMBERSHIP_LOOKUP_INTERVAL_SEC = config.staatskalender_membership_lookup_interval_sec
+
+    # (connect, read) timeout for Staatskalender requests; shorter than the default, as its responses are small
+    TIMEOUT_SEC = config.staatskalender_timeout_sec
+
+    # Data fields of a Staatskalender person that are read by _parse_person_items()
+    PERSON_FIELD_NAMES = frozenset({'first_name', 'last_name', 'email', 'phone', 'telephone', 'phone_number'})
+
     class StaatskalenderAuth:
         """Handles authentication for Staatskalender API using API key and token."""
 
@@ -25,13 +51,18 @@ class StaatskalenderCache:
 
             # Token caching
             self.token = None
+            self._token_lock = threading.Lock()
 
         def get_token(self):
             """Get a valid token, either from cache or by requesting a new one."""
             if self.token:
                 return self.token
 
-            return self._request_new_token()
+            # Only one thread requests a new token when prefetching in parallel
+            with self._token_lock:
+                if self.token:
+                    return self.token
+                return self._request_new_token()
 
         def _request_new_token(self):
             """Request a new token using API key authentication."""
@@ -40,7 +71,8 @@ class StaatskalenderCache:
             try:
                 res_auth = requests_get(
                     url=auth_url,
-                    auth=HTTPBasicAuth(self.access_key, "")
+                    auth=HTTPBasicAuth(self.access_key, ""),
+                    timeout=StaatskalenderCache.TIMEOUT_SEC
                 )
                 res_auth.raise_for_status()
 
@@ -60,8 +92,30 @@ class StaatskalenderCache:
     def __init__(self):
         """Initialize the cache with empty caches and authentication."""
         self._membership_cache: Dict[str, Dict] = {}
+        self._failed_membership_cache: Dict[str, str] = {}
         self._person_cache: Dict[str, Dict] = {}
+        self._failed_person_cache: Dict[str, str] = {}
         self._auth = self.StaatskalenderAuth()
+
+        # Shared limiter of the prefetch workers: earliest time (time.monotonic) the next lookup may start
+        self._next_request_time = 0.0
+        self._request_time_lock = threading.Lock()
+    
+    def _wait_for_request_slot(self, interval_sec: float) -> None:
+        """
+        Block until the next lookup may start, so that all prefetch workers together start at most one
+        lookup every interval_sec.
+        
+        Args:
+            interval_sec: Minimum time in seconds between the start of two lookups
+        """
+        with self._request_time_lock:
+            now = time.monotonic()
+            start_time = max(now, self._next_request_time)
+            self._next_request_time = start_time + interval_sec
+        
+        if start_time > now:
+            time.sleep(start_time - now)
     
     def get_membership(self, membership_id: str) -> Dict:
         """
@@ -78,30 +132,62 @@ class StaatskalenderCache:
                 
         Raises:
             DetailedHTTPError: If API request fails after retries
-            Exception: If person link cannot be found in membership data
+            Exception: If person link cannot be found in membership data, or on repeated calls for an ID
+                that failed before (with the message of the original error)
         """
         # Check cache first
         if membership_id in self._membership_cache:
             logging.debug(f"Using cached membership data for {membership_id}")
             return self._membership_cache[membership_id]
         
+        # Do not retry membership IDs that already failed after all retries
+        if membership_id in self._failed_membership_cache:
+            logging.debug(f"Membership {membership_id} could not be retrieved before, not retrying")
+            raise Exception(self._failed_membership_cache[membership_id])
+        
+        try:
+            membership_info = self._retrieve_membership(membership_id)
+        except Exception as e:
+            self._failed_membership_cache[membership_id] = str(e)
+            raise
+        
+        # Cache and return membership data
+        self._membership_cache[membership_id] = membership_info
+        logging.debug(f"Cached membership data for {membership_id}")
+        
+        return membership_info
+    
+    def _retrieve_membership(self, membership_id: str) -> Dict:
+        """
+        Retrieve membership data from the Staatskalender API (uncached).
+        
+        Args:
+            membership_id: The Staatskalender membership ID
+            
+        Returns:
+            dict: Membership data (same format as get_membership)
+            
+        Raises:
+            DetailedHTTPError: If API request fails after retries
+            Exception: If person link cannot be found in membership data
+        """
         logging.debug(f"Retrieving membership data from Staatskalender for membership ID: {membership_id}")
         
         # Retrieve membership data from staatskalender
         membership_url = f"https://staatskalender.bs.ch/api/memberships/{membership_id}"
-        membership_response = requests_get(url=membership_url, auth=self._auth.get_auth())
+        membership_response = requests_get(url=membership_url, auth=self._auth.get_auth(), timeout=self.TIMEOUT_SEC)
         
-        # Extract person link from membership data
+        # Extract person link (first link with rel 'person') from membership data
         membership_data = membership_response.json()
-        person_link = None
-        
-        for item in membership_data.get('collection', {}).get('items', []):
-            for link in item.get('links', []):
-                if link.get('rel') == 'person':
-                    person_link = link.get('href')
-                    break
-            if person_link:
-                break
+        person_link = next(
+            (
+                link.get('href')
+                for item in membership_data.get('collection', {}).get('items', [])
+                for link in item.get('links', [])
+                if link.get('rel') == 'person'
+            ),
+            None
+        )
         
         if not person_link:
             raise Exception(f"Could not find person link in membership data for membership ID {membership_id}")
@@ -109,18 +195,12 @@ class StaatskalenderCache:
         # Extract person_id from person_link (last part of URL)
         person_id = person_link.rsplit('/', 1)[1]
         
-        # Cache and return membership data
-        membership_info = {
+        return {
             'membership_id': membership_id,
             'person_id': person_id,
             'person_link': person_link
         }
-        
-        self._membership_cache[membership_id] = membership_info
-        logging.debug(f"Cached membership data for {membership_id}")
-        
-        return membership_info
-    
+
     def get_person_by_id(self, person_id: str) -> Dict:
         """
         Get person data by person ID (cached).
@@ -139,51 +219,83 @@ class StaatskalenderCache:
                 
         Raises:
             DetailedHTTPError: If API request fails after retries
+            Exception: On repeated calls for an ID that failed before (with the message of the original error)
         """
         # Check cache first
         if person_id in self._person_cache:
             logging.debug(f"Using cached person data for {person_id}")
             return self._person_cache[person_id]
         
+        # Do not retry person IDs that already failed after all retries
+        if person_id in self._failed_person_cache:
+            logging.debug(f"Person {person_id} could not be retrieved before, not retrying")
+            raise Exception(self._failed_person_cache[person_id])
+        
         logging.debug(f"Retrieving person data from Staatskalender for person ID: {person_id}")
         
         # Get person data from Staatskalender
         person_url = f"https://staatskalender.bs.ch/api/people/{person_id}"
-        person_response = requests_get(url=person_url, auth=self._auth.get_auth())
+        try:
+            person_response = requests_get(url=person_url, auth=self._auth.get_auth(), timeout=self.TIMEOUT_SEC)
+        except Exception as e:
+            self._failed_person_cache[person_id] = str(e)
+            raise
         
         # Extract person details
         person_data = person_response.json()
+        person_info = self._parse_person_items(person_id, person_data.get('collection', {}).get('items', []))
+        
+        # Cache and return person data
+        self._person_cache[person_id] = person_info
+        logging.debug(f"Cached person data for {person_id}")
+        
+        return person_info
+    
+    @staticmethod
+    def _parse_person_items(person_id: str, items: list) -> Dict:
+        """
+        Extract the person fields from the collection items of a Staatskalender person response.
+        
+        Args:
+            person_id: The Staatskalender person ID
+            items: The collection items containing the person's data fields
+            
+        Returns:
+            dict: Person data (same format as get_person_by_id)
+        """
         sk_email = None
         sk_phone = None
         sk_first_name = None
         sk_additional_name = None
         sk_last_name = None
         
-        for item in person_data.get('collection', {}).get('items', []):
+        # Single pass over the data fields; a later field overrides an earlier one of the same kind,
+        # except that an empty first_name does not clear a name found before
+        for item in items:
             for data_item in item.get('data', []):
                 field_name = data_item.get('name')
+                if field_name not in StaatskalenderCache.PERSON_FIELD_NAMES:
+                    continue
                 field_value = data_item.get('value')
                 
                 if field_name == 'email':
                     sk_email = field_value
-                elif field_name == 'phone' or field_name == 'telephone' or field_name == 'phone_number':
-                    sk_phone = field_value
                 elif field_name == 'first_name':
                     # Split first_name into givenName and additionalName
-                    raw_first_name = field_value
-                    if raw_first_name:
-                        cleaned_first_name = raw_first_name.strip()
-                        if cleaned_first_name:
-                            parts = cleaned_first_name.split(' ', 1)
-                            sk_first_name = parts[0]
-                            sk_additional_name = parts[1] if len(parts) > 1 else None
+                    cleaned_first_name = field_value.strip() if field_value else None
+                    if cleaned_first_name:
+                        parts = cleaned_first_name.split(' ', 1)
+                        sk_first_name = parts[0]
+                        sk_additional_name = parts[1] if len(parts) > 1 else None
                 elif field_name == 'last_name':
                     sk_last_name = field_value
                     if sk_last_name:
-                        sk_last_name = sk_last_name.strip() if sk_last_name.strip() else None
+                        sk_last_name = sk_last_name.strip() or None
+                else:
+                    # 'phone', 'telephone' or 'phone_number'
+                    sk_phone = field_value
         
-        # Cache and return person data
-        person_info = {
+        return {
             'person_id': person_id,
             'given_name': sk_first_name,
             'additional_name': sk_additional_name,
@@ -191,12 +303,104 @@ class StaatskalenderCache:
             'email': sk_email,
             'phone': sk_phone
         }
+
+    def is_person_cached(self, person_id: str) -> bool:
+        """
+        Check whether a person lookup can be answered without an API request.
         
-        self._person_cache[person_id] = person_info
-        logging.debug(f"Cached person data for {person_id}")
+        Args:
+            person_id: The Staatskalender person ID
+            
+        Returns:
+            bool: True if the person (or a failed lookup of it) is already cached
+        """
+        return person_id in self._person_cache or person_id in self._failed_person_cache
+
+    def prefetch_persons(self, person_ids: Iterable[str], max_workers: int = None) -> None:
+        """
+        Load multiple persons into the cache with parallel requests.
         
-        return person_info
-    
+        Persons that are already cached are skipped. Errors are only logged here; the
+        subsequent get_person_by_id() call raises the remembered error to the caller as usual.
+        
+        Args:
+            person_ids: The Staatskalender person IDs to load
+            max_workers: Number of parallel requests. Defaults to PREFETCH_MAX_WORKERS
+        """
+        missing_ids = [person_id for person_id in dict.fromkeys(person_ids) if not self.is_person_cached(person_id)]
+        if not missing_ids:
+            return
+
+        logging.info(f"Prefetching {len(missing_ids)} persons from Staatskalender...")
+
+        def fetch(person_id: str) -> None:
+            self._wait_for_request_slot(self.PREFETCH_REQUEST_INTERVAL_SEC)
+            try:
+                self.get_person_by_id(person_id)
+            except Exception as e:
+                logging.debug(f"Prefetching person {person_id} from Staatskalender failed: {str(e)}")
+
+        with ThreadPoolExecutor(max_workers=max_workers or self.PREFETCH_MAX_WORKERS) as executor:
+            list(executor.map(fetch, missing_ids))
+
+        logging.info(f"Prefetched persons from Staatskalender ({len(self._person_cache)} persons cached)")
+
+    def is_membership_cached(self, membership_id: str) -> bool:
+        """
+        Check whether a person lookup by membership can be answered without an API request.
+        
+        Args:
+            membership_id: The Staatskalender membership ID
+            
+        Returns:
+            bool: True if the membership and its person (or a failed lookup of either) are already cached
+        """
+        if membership_id in self._failed_membership_cache:
+            return True
+        membership_info = self._membership_cache.get(membership_id)
+        return membership_info is not None and self.is_person_cached(membership_info['person_id'])
+
+    def prefetch_memberships(self, membership_ids: Iterable[str], max_workers: int = None) -> None:
+        """
+        Load multiple memberships and their persons into the cache with parallel requests.
+        
+        The memberships are loaded first, at most one every MEMBERSHIP_LOOKUP_INTERVAL_SEC across all
+        workers, then their persons via prefetch_persons(), so a person with several memberships is only
+        requested once. Memberships that are already cached are skipped. Errors are only logged here;
+        the subsequent get_person_by_membership() call raises the remembered error to the caller as usual.
+        
+        Args:
+            membership_ids: The Staatskalender membership IDs to load
+            max_workers: Number of parallel requests. Defaults to PREFETCH_MAX_WORKERS
+        """
+        membership_ids = list(dict.fromkeys(membership_ids))
+        missing_ids = [
+            membership_id for membership_id in membership_ids
+            if membership_id not in self._membership_cache and membership_id not in self._failed_membership_cache
+        ]
+
+        if missing_ids:
+            logging.info(f"Prefetching {len(missing_ids)} memberships from Staatskalender...")
+
+            def fetch(membership_id: str) -> None:
+                self._wait_for_request_slot(self.MEMBERSHIP_LOOKUP_INTERVAL_SEC)
+                try:
+                    self.get_membership(membership_id)
+                except Exception as e:
+                    logging.debug(f"Prefetching membership {membership_id} from Staatskalender failed: {str(e)}")
+
+            with ThreadPoolExecutor(max_workers=max_workers or self.PREFETCH_MAX_WORKERS) as executor:
+                list(executor.map(fetch, missing_ids))
+
+            logging.info(f"Prefetched memberships from Staatskalender ({len(self._membership_cache)} memberships cached)")
+
+        # Load the persons of all requested memberships; prefetch_persons() skips duplicates and cached persons
+        self.prefetch_persons(
+            self._membership_cache[membership_id]['person_id']
+            for membership_id in membership_ids
+            if membership_id in self._membership_cache
+        )
+
     def get_person_by_membership(self, membership_id: str) -> Dict:
         """
         Get person data via membership ID (cached).
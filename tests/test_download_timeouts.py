@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+Test script for the timeouts of Download API requests
+
+This script tests that the Download API exports are requested with the long
+download timeout instead of the default timeout of regular calls.
+"""
+
+import sys
+import os
+import pytest
+
+# Add the parent directory to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.common import HTTP_DOWNLOAD_TIMEOUT_SEC, HTTP_TIMEOUT_SEC
+import src.clients.base_client as base_client
+import src.clients.law_client as law_client
+import scripts.catalog_quality_daily.check_7_yaml as check_7_yaml
+
+
+class FakeAuth:
+    """Minimal stand-in for DataspotAuth that does not request a token."""
+
+    def get_headers(self):
+        return {'Authorization': 'Bearer test'}
+
+
+class FakeResponse:
+    """Minimal stand-in for a requests.Response of a download call."""
+
+    text = ''
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return []
+
+
+class RecordingGet:
+    """Records the keyword arguments of each requests_get call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append(kwargs)
+        return FakeResponse()
+
+
+def _client(client_class):
+    # Skip __init__, which would authenticate against Dataspot
+    client = object.__new__(client_class)
+    client.auth = FakeAuth()
+    client.scheme_name = 'Test'
+    client.scheme_name_short = 'TST'
+    client._collections_cache = None
+    return client
+
+
+class TestDownloadTimeouts:
+    """Test cases for the timeouts used by the download paths."""
+
+    def test_download_timeout_is_longer_than_default(self):
+        assert HTTP_DOWNLOAD_TIMEOUT_SEC[1] > HTTP_TIMEOUT_SEC[1]
+
+    def test_scheme_collections_download(self, monkeypatch):
+        recording_get = RecordingGet()
+        monkeypatch.setattr(base_client, 'requests_get', recording_get)
+        _client(base_client.BaseDataspotClient).get_collections_with_cache()
+        assert [call['timeout'] for call in recording_get.calls] == [HTTP_DOWNLOAD_TIMEOUT_SEC]
+
+    def test_law_collection_download(self, monkeypatch):
+        recording_get = RecordingGet()
+        monkeypatch.setattr(law_client, 'requests_get', recording_get)
+        _client(law_client.LAWClient).download_law_assets_in_collection('collection-uuid')
+        assert [call['timeout'] for call in recording_get.calls] == [HTTP_DOWNLOAD_TIMEOUT_SEC]
+
+    def test_yaml_profile_download(self, monkeypatch):
+        recording_get = RecordingGet()
+        monkeypatch.setattr(check_7_yaml, 'requests_get', recording_get)
+        check_7_yaml.check_7_yaml(_client(base_client.BaseDataspotClient))
+        assert len(recording_get.calls) == len(check_7_yaml.YAML_PROFILES)
+        assert all(call['timeout'] == HTTP_DOWNLOAD_TIMEOUT_SEC for call in recording_get.calls)
+
+
+# This allows running the test file directly
+if __name__ == "__main__":
+    # Run the tests with pytest
+    pytest.main(["-v", __file__])
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+"""
+Test script for the get_created_asset_id function
+
+This script tests that the id of a newly created asset is read from the
+response body, with the Location header as fallback.
+"""
+
+import sys
+import os
+import json
+import pytest
+
+# Add the parent directory to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.clients.helpers import get_created_asset_id
+
+
+class FakeResponse:
+    """Minimal stand-in for a requests.Response of a create call."""
+
+    def __init__(self, body=None, headers=None):
+        self._body = body
+        self.headers = headers or {}
+
+    def json(self):
+        if self._body is None:
+            raise json.JSONDecodeError("Expecting value", "", 0)
+        return self._body
+
+
+class TestGetCreatedAssetId:
+    """Test cases for the get_created_asset_id function."""
+
+    def test_id_from_body(self):
+        response = FakeResponse(body={'id': 'abc-123'}, headers={'Location': '/rest/prod/users/other'})
+        assert get_created_asset_id(response) == 'abc-123'
+
+    def test_id_from_location_header(self):
+        response = FakeResponse(body={}, headers={'Location': 'https://host/rest/prod/users/abc-123'})
+        assert get_created_asset_id(response) == 'abc-123'
+
+    def test_empty_body_uses_location_header(self):
+        response = FakeResponse(body=None, headers={'Location': '/rest/prod/users/abc-123/'})
+        assert get_created_asset_id(response) == 'abc-123'
+
+    def test_no_id_available(self):
+        assert get_created_asset_id(FakeResponse(body={})) is None
+
+
+# This allows running the test file directly
+if __name__ == "__main__":
+    # Run the tests with pytest
+    pytest.main(["-v", __file__])
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""
+Test script for StaatskalenderCache._parse_person_items
+
+This script tests which value wins when a Staatskalender person response
+contains several fields of the same kind.
+"""
+
+import sys
+import os
+import pytest
+
+# Add the parent directory to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.staatskalender_cache import StaatskalenderCache
+
+
+def _parse(*fields):
+    """Parse a response whose single item contains the given (name, value) data fields."""
+    items = [{'data': [{'name': name, 'value': value} for name, value in fields]}]
+    return StaatskalenderCache._parse_person_items('person-1', items)
+
+
+class TestParsePersonItems:
+    """Test cases for the _parse_person_items function."""
+
+    # Test a complete person
+    def test_basic_person(self):
+        assert _parse(
+            ('first_name', ' Anna Maria '),
+            ('last_name', ' Muster '),
+            ('email', 'anna.muster@bs.ch'),
+            ('phone', '+41 61 000 00 00'),
+            ('title', 'ignored'),
+        ) == {
+            'person_id': 'person-1',
+            'given_name': 'Anna',
+            'additional_name': 'Maria',
+            'family_name': 'Muster',
+            'email': 'anna.muster@bs.ch',
+            'phone': '+41 61 000 00 00'
+        }
+
+    # Test that the last phone field wins, regardless of its name
+    def test_phone_last_field_wins(self):
+        assert _parse(('phone', '1'), ('telephone', '2'), ('phone_number', '3'))['phone'] == '3'
+        assert _parse(('phone_number', '3'), ('telephone', '2'), ('phone', '1'))['phone'] == '1'
+        assert _parse(('phone', '1'), ('telephone', None))['phone'] is None
+
+    # Test that an empty first_name does not clear an earlier one
+    def test_empty_first_name_keeps_earlier(self):
+        person = _parse(('first_name', 'Anna Maria'), ('first_name', '  '))
+        assert person['given_name'] == 'Anna'
+        assert person['additional_name'] == 'Maria'
+        person = _parse(('first_name', 'Anna Maria'), ('first_name', 'Berta'))
+        assert person['given_name'] == 'Berta'
+        assert person['additional_name'] is None
+
+    # Test that a later last_name overrides an earlier one, also when empty
+    def test_last_name_last_field_wins(self):
+        assert _parse(('last_name', 'Muster'), ('last_name', 'Beispiel'))['family_name'] == 'Beispiel'
+        assert _parse(('last_name', 'Muster'), ('last_name', '  '))['family_name'] is None
+        assert _parse(('last_name', 'Muster'), ('last_name', None))['family_name'] is None
+
+    # Test edge cases
+    def test_edge_cases(self):
+        assert _parse() == {
+            'person_id': 'person-1',
+            'given_name': None,
+            'additional_name': None,
+            'family_name': None,
+            'email': None,
+            'phone': None
+        }
+        assert StaatskalenderCache._parse_person_items('person-1', []) == _parse()
+
+
+# This allows running the test file directly
+if __name__ == "__main__":
+    # Run the tests with pytest
+    pytest.main(["-v", __file__])
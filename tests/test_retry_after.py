@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""
+Test script for the Retry-After handling of the retry decorator
+
+This script tests that the delay requested via the Retry-After header is read
+both in seconds and as HTTP date, and that it is capped.
+"""
+
+import sys
+import os
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import pytest
+
+# Add the parent directory to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.common.retry import _retry_after_seconds, RETRY_AFTER_MAX_SEC
+
+
+class FakeResponse:
+    """Minimal stand-in for a requests.Response of a rejected call."""
+
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class FakeHTTPError(Exception):
+    """Minimal stand-in for a requests.HTTPError carrying the response."""
+
+    def __init__(self, response):
+        super().__init__(f"HTTP {response.status_code}")
+        self.response = response
+
+
+def _retry_after(headers, status_code=429):
+    return _retry_after_seconds(FakeHTTPError(FakeResponse(status_code, headers)))
+
+
+class TestRetryAfter:
+    """Test cases for reading the Retry-After header."""
+
+    # Test the delay given in seconds
+    def test_seconds(self):
+        assert _retry_after({'Retry-After': '30'}) == 30
+        assert _retry_after({'Retry-After': '1.5'}, status_code=503) == 1.5
+
+    # Test the delay given as HTTP date
+    def test_http_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+        seconds = _retry_after({'Retry-After': format_datetime(retry_at, usegmt=True)})
+        # The HTTP date has a resolution of one second
+        assert 55 <= seconds <= 60
+
+    def test_http_date_in_the_past(self):
+        retry_at = datetime.now(timezone.utc) - timedelta(minutes=5)
+        assert _retry_after({'Retry-After': format_datetime(retry_at, usegmt=True)}) == 0
+
+    # Test that the delay is capped
+    def test_cap(self):
+        assert _retry_after({'Retry-After': '86400'}) == RETRY_AFTER_MAX_SEC
+        retry_at = datetime.now(timezone.utc) + timedelta(days=1)
+        assert _retry_after({'Retry-After': format_datetime(retry_at, usegmt=True)}) == RETRY_AFTER_MAX_SEC
+
+    # Test cases where the regular backoff is used
+    def test_no_retry_after(self):
+        assert _retry_after({}) is None
+        assert _retry_after({'Retry-After': 'soon'}) is None
+        assert _retry_after({'Retry-After': '30'}, status_code=500) is None
+        assert _retry_after_seconds(ValueError("no response")) is None
+
+
+# This allows running the test file directly
+if __name__ == "__main__":
+    # Run the tests with pytest
+    pytest.main(["-v", __file__])
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+"""
+Test script for the sql_string_literal function
+
+This script tests the sql_string_literal function with various inputs,
+including names with apostrophes as they occur in the Staatskalender.
+"""
+
+import sys
+import os
+import pytest
+
+# Add the parent directory to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.clients.helpers import sql_string_literal
+
+
+class TestSqlStringLiteral:
+    """Test cases for the sql_string_literal function."""
+
+    # Test basic cases (no single quotes)
+    def test_basic_cases(self):
+        assert sql_string_literal('Adresse') == "'Adresse'"
+        assert sql_string_literal('/Datenprodukte/Test') == "'/Datenprodukte/Test'"
+
+    # Test embedded single quotes - these need doubling
+    def test_embedded_single_quotes(self):
+        assert sql_string_literal("it's") == "'it''s'"
+        assert sql_string_literal("'Zitat'") == "'''Zitat'''"
+
+    # Test names with apostrophes
+    def test_names_with_apostrophes(self):
+        assert sql_string_literal("O'Neil") == "'O''Neil'"
+        assert sql_string_literal("Müller-D'Amato") == "'Müller-D''Amato'"
+
+    # Test values that cannot end the literal early
+    def test_injection_attempt(self):
+        assert sql_string_literal("x' OR '1'='1") == "'x'' OR ''1''=''1'"
+
+    # Test edge cases
+    def test_edge_cases(self):
+        assert sql_string_literal("") == "''"
+        assert sql_string_literal("''") == "''''''"
+        # Double quotes are not special in SQL string literals
+        assert sql_string_literal('""') == "'\"\"'"
+
+
+# This allows running the test file directly
+if __name__ == "__main__":
+    # Run the tests with pytest
+    pytest.main(["-v", __file__])